@@ -0,0 +1,190 @@
+"""Approximate distinct-count analytics using HyperLogLog sketches."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from dream_book_analyzer.data.aggregate_cache import PartitionAggregateCache
+from dream_book_analyzer.data.name_normalization import canonical_person_key, canonical_publisher_key
+from dream_book_analyzer.data.repository import BookRepository
+from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.date_parsing import extract_year
+from dream_book_analyzer.utils.hyperloglog import HyperLogLog, hash_values
+
+DIMENSIONS = ("authors", "publishers", "languages")
+
+# Record field and canonical key function per dimension. Canonical keys make
+# spelling variants of the same entity count once.
+DIMENSION_KEYS: Dict[str, Tuple[str, Callable[[str], str]]] = {
+    "authors": ("author", canonical_person_key),
+    "publishers": ("book_publisher", canonical_publisher_key),
+    "languages": ("language", lambda language: language.strip().lower()),
+}
+MISSING_VALUES = {"", "nan", "unknown"}
+
+
+class CardinalityStatistics:
+    """Distinct-count sketches per dimension, overall and per publication year.
+
+    Statistics built from separate dataset partitions can be combined with
+    :meth:`merge` as long as they share the same precision. ``fingerprint``
+    records the partition the statistics were built from, if any.
+    """
+
+    def __init__(self, precision: int, fingerprint: Optional[str] = None) -> None:
+        self.precision = precision
+        self.fingerprint = fingerprint
+        self.overall: Dict[str, HyperLogLog] = {dimension: HyperLogLog(precision) for dimension in DIMENSIONS}
+        self.per_year: Dict[int, Dict[str, HyperLogLog]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "CardinalityStatistics":
+        """Load statistics previously written with :meth:`save`."""
+
+        with np.load(path) as archive:
+            fingerprint = str(archive["fingerprint"]) if "fingerprint" in archive.files else None
+            statistics = cls(int(archive["precision"]), fingerprint)
+            for name in archive.files:
+                scope, _, dimension = name.partition("/")
+                if not dimension:
+                    continue
+                sketch = HyperLogLog(statistics.precision, archive[name])
+                if scope == "overall":
+                    statistics.overall[dimension] = sketch
+                else:
+                    statistics.year_sketches(int(scope))[dimension] = sketch
+        return statistics
+
+    def save(self, path: Path) -> None:
+        """Persist the sketch registers as a compressed NumPy archive."""
+
+        arrays = {"precision": np.array(self.precision)}
+        if self.fingerprint is not None:
+            arrays["fingerprint"] = np.array(self.fingerprint)
+        for dimension, sketch in self.overall.items():
+            arrays[f"overall/{dimension}"] = sketch.registers
+        for year, sketches in self.per_year.items():
+            for dimension, sketch in sketches.items():
+                arrays[f"{year}/{dimension}"] = sketch.registers
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            np.savez_compressed(handle, **arrays)
+
+    @property
+    def standard_error(self) -> float:
+        """Relative standard error of every estimate."""
+        return self.overall[DIMENSIONS[0]].standard_error
+
+    def year_sketches(self, year: int) -> Dict[str, HyperLogLog]:
+        """Return the sketches for a year, creating empty ones when needed."""
+
+        sketches = self.per_year.get(year)
+        if sketches is None:
+            sketches = {dimension: HyperLogLog(self.precision) for dimension in DIMENSIONS}
+            self.per_year[year] = sketches
+        return sketches
+
+    def merge(self, other: "CardinalityStatistics") -> None:
+        """Merge another set of statistics into this one."""
+
+        for dimension, sketch in other.overall.items():
+            self.overall[dimension].merge(sketch)
+        for year, sketches in other.per_year.items():
+            target = self.year_sketches(year)
+            for dimension, sketch in sketches.items():
+                target[dimension].merge(sketch)
+
+    def overall_counts(self) -> Dict[str, int]:
+        """Return estimated distinct counts per dimension across all records."""
+        return {dimension: sketch.estimate() for dimension, sketch in self.overall.items()}
+
+    def yearly_counts(self) -> Dict[int, Dict[str, int]]:
+        """Return estimated distinct counts per dimension for each publication year."""
+
+        return {
+            year: {dimension: sketch.estimate() for dimension, sketch in self.per_year[year].items()}
+            for year in sorted(self.per_year)
+        }
+
+
+class CardinalityAnalyzer:
+    """Estimate distinct authors, publishers and languages overall and per year.
+
+    Each sketch uses ``2 ** precision`` bytes regardless of dataset size; the
+    precision is chosen from the requested relative error. Records are consumed
+    in chunks so the analyzer can run over a streamed dataset. With a cache
+    directory, the sketches of each dataset partition are persisted and only
+    partitions that changed are re-read before the sketches are merged.
+    """
+
+    def __init__(
+        self,
+        error: float = 0.02,
+        chunk_size: int = 100_000,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self._precision = HyperLogLog.for_error(error).precision
+        self._chunk_size = chunk_size
+        self._cache = PartitionAggregateCache(cache_dir, self._load_statistics, self.analyze)
+
+    def analyze_repository(self, repository: BookRepository) -> CardinalityStatistics:
+        """Merge the per-partition sketches of a repository, rebuilding only stale partitions."""
+
+        statistics = CardinalityStatistics(self._precision)
+        for partition_statistics in self._cache.collect(repository):
+            statistics.merge(partition_statistics)
+        return statistics
+
+    def analyze(self, records: Iterable[BookRecord], fingerprint: Optional[str] = None) -> CardinalityStatistics:
+        """Build sketches for the records, tagged with the fingerprint of their partition."""
+
+        statistics = CardinalityStatistics(self._precision, fingerprint)
+        chunk: List[BookRecord] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self._chunk_size:
+                self._add_chunk(statistics, chunk)
+                chunk = []
+        self._add_chunk(statistics, chunk)
+        return statistics
+
+    def _load_statistics(self, path: Path) -> CardinalityStatistics:
+        statistics = CardinalityStatistics.load(path)
+        if statistics.precision != self._precision:
+            raise ValueError("Cached sketches use a different precision.")
+        return statistics
+
+    def _add_chunk(self, statistics: CardinalityStatistics, chunk: List[BookRecord]) -> None:
+        if not chunk:
+            return
+        years = np.fromiter(
+            (extract_year(record.publication_date) or 0 for record in chunk), dtype=np.int64, count=len(chunk)
+        )
+        # Group row indexes by year with one sort instead of a mask per year.
+        order = np.argsort(years, kind="stable")
+        sorted_years = years[order]
+        boundaries = np.flatnonzero(np.diff(sorted_years)) + 1
+        groups = np.split(order, boundaries)
+        group_years = sorted_years[np.concatenate(([0], boundaries))].tolist()
+
+        for dimension, (field_name, key_function) in DIMENSION_KEYS.items():
+            # Canonical keys are computed and hashed once per distinct raw value in the chunk.
+            codes_by_value: Dict[str, int] = {}
+            codes = np.fromiter(
+                (codes_by_value.setdefault(getattr(record, field_name), len(codes_by_value)) for record in chunk),
+                dtype=np.int64,
+                count=len(chunk),
+            )
+            keys = [key_function(value) for value in codes_by_value]
+            present = np.fromiter((key not in MISSING_VALUES for key in keys), dtype=bool, count=len(keys))
+            hashes = hash_values(keys)
+
+            statistics.overall[dimension].add_hashes(hashes[present])
+            for year, rows in zip(group_years, groups):
+                if year <= 0:
+                    continue
+                year_codes = np.unique(codes[rows])
+                statistics.year_sketches(year)[dimension].add_hashes(hashes[year_codes[present[year_codes]]])
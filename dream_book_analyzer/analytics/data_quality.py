@@ -0,0 +1,239 @@
+"""ISBN validity and duplicate record analytics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.hyperloglog import hash_values
+
+ISBN10_WEIGHTS = np.arange(10, 0, -1, dtype=np.int64)
+ISBN13_WEIGHTS = np.tile(np.array([1, 3], dtype=np.int64), 7)[:13]
+
+
+@dataclass(frozen=True)
+class DuplicateSummary:
+    """Duplicate statistics for a single identifier column."""
+
+    duplicate_keys: int
+    duplicate_rows: int
+    examples: List[Tuple[str, int]]
+
+
+@dataclass(frozen=True)
+class DataQualityReport:
+    """Result of the data quality analysis."""
+
+    total: int
+    missing_isbn: int
+    valid_isbn10: int
+    valid_isbn13: int
+    invalid_checksum: int
+    malformed_isbn: int
+    invalid_examples: List[str]
+    isbn_duplicates: DuplicateSummary
+    bnb_duplicates: DuplicateSummary
+
+
+class _SortedHashSet:
+    """Set of 64-bit hashes stored as sorted NumPy runs, about 8 bytes per key.
+
+    New keys are appended as a sorted run and runs of similar size are merged,
+    so each key is re-merged only a logarithmic number of times.
+    """
+
+    def __init__(self) -> None:
+        self._runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[positions] == hashes
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add sorted hashes that are not yet in the set."""
+
+        if len(hashes) == 0:
+            return
+        self._runs.append(hashes)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            newest = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate((self._runs[-1], newest)))
+
+
+class _DuplicateIndex:
+    """Single-pass duplicate detector backed by sorted arrays of key hashes.
+
+    Only stable 64-bit hashes are retained, so memory grows by about 8 bytes
+    per distinct key regardless of key length, and the probability of a false
+    duplicate stays negligible for tens of millions of keys.
+    """
+
+    def __init__(self, max_examples: int) -> None:
+        self._max_examples = max_examples
+        self._seen = _SortedHashSet()
+        self._duplicated = _SortedHashSet()
+        self._duplicate_rows = 0
+        self._examples: Dict[int, List] = {}
+
+    def add_many(self, keys: List[str]) -> None:
+        if not keys:
+            return
+        hashes = hash_values(keys)
+        order = np.argsort(hashes, kind="stable")
+        unique, first, counts = np.unique(hashes[order], return_index=True, return_counts=True)
+
+        in_seen = self._seen.contains(unique)
+        self._duplicate_rows += len(hashes) - int(np.count_nonzero(~in_seen))
+        new_duplicates = (in_seen | (counts > 1)) & ~self._duplicated.contains(unique)
+
+        for key_hash, example in self._examples.items():
+            position = int(np.searchsorted(unique, np.uint64(key_hash)))
+            if position < len(unique) and unique[position] == key_hash:
+                example[1] += int(counts[position])
+
+        for index in np.flatnonzero(new_duplicates)[: self._max_examples - len(self._examples)]:
+            key = keys[order[first[index]]]
+            self._examples[int(unique[index])] = [key, int(counts[index]) + int(in_seen[index])]
+
+        self._duplicated.add(unique[new_duplicates])
+        self._seen.add(unique[~in_seen])
+
+    def summary(self) -> DuplicateSummary:
+        examples = sorted(((key, count) for key, count in self._examples.values()), key=lambda item: -item[1])
+        return DuplicateSummary(
+            duplicate_keys=len(self._duplicated),
+            duplicate_rows=self._duplicate_rows,
+            examples=examples,
+        )
+
+
+class DataQualityAnalyzer:
+    """Validate ISBN checksums and detect duplicate ISBN and BNB id records.
+
+    Records are consumed in fixed-size chunks so the analyzer can run over a
+    streamed dataset; apart from the current chunk, memory is limited to the
+    duplicate hash indexes at about 8 bytes per distinct identifier.
+    """
+
+    def __init__(self, chunk_size: int = 100_000, max_examples: int = 5) -> None:
+        self._chunk_size = chunk_size
+        self._max_examples = max_examples
+
+    def analyze(self, records: Iterable[BookRecord]) -> DataQualityReport:
+        isbn_index = _DuplicateIndex(self._max_examples)
+        bnb_index = _DuplicateIndex(self._max_examples)
+        counts = {"total": 0, "missing": 0, "isbn10": 0, "isbn13": 0, "checksum": 0, "malformed": 0}
+        invalid_examples: List[str] = []
+
+        isbns: List[str] = []
+        bnb_ids: List[str] = []
+
+        def flush() -> None:
+            self._process_chunk(isbns, counts, invalid_examples)
+            isbn_index.add_many([isbn for isbn in isbns if isbn])
+            bnb_index.add_many([bnb_id for bnb_id in bnb_ids if bnb_id])
+            isbns.clear()
+            bnb_ids.clear()
+
+        for record in records:
+            isbns.append(normalize_isbn(record.isbn))
+            bnb_ids.append(_normalize_bnb_id(record.bnb_id))
+            if len(isbns) >= self._chunk_size:
+                flush()
+        flush()
+
+        return DataQualityReport(
+            total=counts["total"],
+            missing_isbn=counts["missing"],
+            valid_isbn10=counts["isbn10"],
+            valid_isbn13=counts["isbn13"],
+            invalid_checksum=counts["checksum"],
+            malformed_isbn=counts["malformed"],
+            invalid_examples=invalid_examples,
+            isbn_duplicates=isbn_index.summary(),
+            bnb_duplicates=bnb_index.summary(),
+        )
+
+    def _process_chunk(self, isbns: List[str], counts: Dict[str, int], invalid_examples: List[str]) -> None:
+        if not isbns:
+            return
+        counts["total"] += len(isbns)
+        present = [isbn for isbn in isbns if isbn]
+        counts["missing"] += len(isbns) - len(present)
+
+        valid10, checksum10 = _check_isbn10(present)
+        valid13, checksum13 = _check_isbn13(present)
+        counts["isbn10"] += int(valid10.sum())
+        counts["isbn13"] += int(valid13.sum())
+
+        checksum_failures = checksum10 | checksum13
+        malformed = ~(valid10 | valid13 | checksum_failures)
+        counts["checksum"] += int(checksum_failures.sum())
+        counts["malformed"] += int(malformed.sum())
+
+        if len(invalid_examples) < self._max_examples:
+            for index in np.flatnonzero(checksum_failures | malformed)[: self._max_examples - len(invalid_examples)]:
+                invalid_examples.append(present[index])
+
+
+def normalize_isbn(isbn: Optional[str]) -> str:
+    """Return the ISBN without separators, or an empty string when it is missing."""
+
+    if isbn is None:
+        return ""
+    text = str(isbn).strip().upper()
+    if text in ("", "NAN", "NONE"):
+        return ""
+    return text.replace("-", "").replace(" ", "")
+
+
+def _normalize_bnb_id(bnb_id: str) -> str:
+    text = str(bnb_id or "").strip().upper()
+    return "" if text in ("NAN", "NONE") else text
+
+
+def _digit_matrix(isbns: List[str], length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a boolean mask of candidates of the given length and their ASCII code matrix."""
+
+    encoded = [isbn.encode("ascii", "replace") for isbn in isbns]
+    mask = np.fromiter((len(value) == length for value in encoded), dtype=bool, count=len(encoded))
+    selected = [value for value, keep in zip(encoded, mask) if keep]
+    matrix = np.frombuffer(b"".join(selected), dtype=np.uint8).reshape(-1, length).astype(np.int64)
+    return mask, matrix
+
+
+def _check_isbn10(isbns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return masks of valid ISBN-10 values and well-formed ISBN-10 values with a bad checksum."""
+
+    mask, codes = _digit_matrix(isbns, 10)
+    digits = codes - ord("0")
+    check = np.where(codes[:, 9] == ord("X"), 10, digits[:, 9])
+    well_formed = np.all((digits[:, :9] >= 0) & (digits[:, :9] <= 9), axis=1) & (check >= 0) & (check <= 10)
+    digits[:, 9] = check
+    checksum_ok = (digits @ ISBN10_WEIGHTS) % 11 == 0
+    return _scatter(mask, well_formed & checksum_ok), _scatter(mask, well_formed & ~checksum_ok)
+
+
+def _check_isbn13(isbns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return masks of valid ISBN-13 values and well-formed ISBN-13 values with a bad checksum."""
+
+    mask, codes = _digit_matrix(isbns, 13)
+    digits = codes - ord("0")
+    well_formed = np.all((digits >= 0) & (digits <= 9), axis=1)
+    checksum_ok = (digits @ ISBN13_WEIGHTS) % 10 == 0
+    return _scatter(mask, well_formed & checksum_ok), _scatter(mask, well_formed & ~checksum_ok)
+
+
+def _scatter(mask: np.ndarray, values: np.ndarray) -> np.ndarray:
+    result = np.zeros(len(mask), dtype=bool)
+    result[mask] = values
+    return result
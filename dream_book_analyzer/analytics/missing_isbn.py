@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, Tuple
 
+from dream_book_analyzer.analytics.rollups import Rollups
 from dream_book_analyzer.domain.models import BookRecord
 
 
@@ -20,3 +21,7 @@ class MissingIsbnAnalyzer:
                 missing += 1
         percentage = missing / total if total else 0
         return missing, total, percentage
+
+    def analyze_rollups(self, rollups: Rollups, grain: str = "year") -> Dict[int, Tuple[int, int, float]]:
+        """Return missing ISBN counts per period from precomputed rollups."""
+        return rollups.missing_isbn(grain)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import Counter
 from typing import Dict, Iterable
 
+from dream_book_analyzer.analytics.rollups import Rollups
 from dream_book_analyzer.domain.models import BookRecord
 from dream_book_analyzer.utils.date_parsing import extract_year
 
@@ -20,3 +21,7 @@ class PublicationTrendsAnalyzer:
                 continue
             counts[year] += 1
         return dict(sorted(counts.items()))
+
+    def analyze_rollups(self, rollups: Rollups, grain: str = "year") -> Dict[int, int]:
+        """Answer the same query from precomputed rollups at month, year or decade grain."""
+        return rollups.trend(grain)
@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
+from dream_book_analyzer.data.name_normalization import NameNormalizer
 from dream_book_analyzer.domain.models import BookRecord
 
 
 class PublisherCountsAnalyzer:
-    """Count books published by each publisher."""
+    """Count books published by each publisher.
+
+    When a normalizer is given, publisher name variants are counted together.
+    """
+
+    def __init__(self, normalizer: Optional[NameNormalizer] = None) -> None:
+        self._normalizer = normalizer
 
     def analyze(self, records: Iterable[BookRecord]) -> List[Tuple[str, int]]:
         counts: Counter[str] = Counter()
         for record in records:
             publisher = record.book_publisher or "Unknown"
             counts[publisher] += 1
+        if self._normalizer is not None:
+            counts = self._normalizer.merge_counts(counts)
         return counts.most_common()
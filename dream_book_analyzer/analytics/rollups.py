@@ -0,0 +1,324 @@
+"""Materialized count rollups at month, year and decade granularity."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dream_book_analyzer.data.aggregate_cache import PartitionAggregateCache
+from dream_book_analyzer.data.repository import BookRepository
+from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.date_parsing import extract_year_month
+
+GRAINS = ("month", "year", "decade")
+DIMENSIONS = ("language", "publisher", "isbn")
+ISBN_CATEGORIES = ("Missing ISBN", "Has ISBN")
+
+# Number of periods between a period and the same period one year earlier.
+# Decades have no year-over-year counterpart, so growth is decade-over-decade.
+GROWTH_LAGS = {"month": 12, "year": 1, "decade": 1}
+
+
+class Rollups:
+    """Pre-aggregated book counts that answer trend queries without raw records.
+
+    Each grain stores a contiguous timeline of period labels with dense totals.
+    Each dimension within a grain is stored sparsely as parallel arrays of
+    period index, category index and count. Period labels are ``YYYYMM`` for
+    months, the year for years and the first year of the decade for decades.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        self._arrays = arrays
+
+    @classmethod
+    def combine(cls, parts: Sequence["Rollups"]) -> "Rollups":
+        """Sum rollups built from disjoint slices of the dataset.
+
+        Timelines are widened to cover every part and category lists are
+        unioned, so the result equals rollups built from all records at once.
+        """
+
+        if len(parts) == 1:
+            return parts[0]
+
+        arrays: Dict[str, np.ndarray] = {}
+        for grain in GRAINS:
+            timelines = [_timeline_keys(grain, part.periods(grain)) for part in parts]
+            starts = [int(keys[0]) for keys in timelines if len(keys)]
+            if starts:
+                start = min(starts)
+                stop = max(int(keys[-1]) for keys in timelines if len(keys)) + 1
+            else:
+                start = stop = 0
+            periods = _period_labels(grain, np.arange(start, stop, dtype=np.int64))
+            totals = np.zeros(len(periods), dtype=np.int64)
+            for part, keys in zip(parts, timelines):
+                if len(keys):
+                    totals[keys[0] - start:keys[-1] - start + 1] += part.totals(grain)
+            arrays[f"{grain}/periods"] = periods
+            arrays[f"{grain}/totals"] = totals
+
+            for dimension in DIMENSIONS:
+                prefix = f"{grain}/{dimension}"
+                categories = np.unique(
+                    np.concatenate([part._arrays[f"{prefix}/categories"] for part in parts] or [np.zeros(0, str)])
+                )
+                offsets: List[np.ndarray] = []
+                codes: List[np.ndarray] = []
+                weights: List[np.ndarray] = []
+                for part, keys in zip(parts, timelines):
+                    if not len(keys):
+                        continue
+                    remap = np.searchsorted(categories, part._arrays[f"{prefix}/categories"])
+                    offsets.append(part._arrays[f"{prefix}/period_index"] + (int(keys[0]) - start))
+                    codes.append(remap[part._arrays[f"{prefix}/category_index"]].astype(np.int64))
+                    weights.append(part._arrays[f"{prefix}/counts"])
+                period_index, category_index, counts = _sparse_counts(
+                    np.concatenate(offsets) if offsets else np.zeros(0, dtype=np.int64),
+                    np.concatenate(codes) if codes else np.zeros(0, dtype=np.int64),
+                    len(categories),
+                    np.concatenate(weights) if weights else None,
+                )
+                arrays[f"{prefix}/categories"] = categories
+                arrays[f"{prefix}/period_index"] = period_index
+                arrays[f"{prefix}/category_index"] = category_index
+                arrays[f"{prefix}/counts"] = counts
+        return cls(arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "Rollups":
+        """Load rollups previously written with :meth:`save`."""
+
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def save(self, path: Path) -> None:
+        """Persist the rollups as a compressed NumPy archive."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            np.savez_compressed(handle, **self._arrays)
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Fingerprint of the dataset partition the rollups were built from, if known."""
+
+        value = self._arrays.get("fingerprint")
+        return str(value) if value is not None and value.size else None
+
+    def periods(self, grain: str) -> np.ndarray:
+        """Return the contiguous period labels for a grain."""
+
+        return self._arrays[f"{_check_grain(grain)}/periods"]
+
+    def totals(self, grain: str) -> np.ndarray:
+        """Return the book count for every period of a grain, including empty periods."""
+
+        return self._arrays[f"{_check_grain(grain)}/totals"]
+
+    def trend(self, grain: str) -> Dict[int, int]:
+        """Return book counts per non-empty period."""
+
+        periods = self.periods(grain)
+        totals = self.totals(grain)
+        mask = totals > 0
+        return dict(zip(periods[mask].tolist(), totals[mask].tolist()))
+
+    def breakdown(self, grain: str, dimension: str) -> Dict[int, Dict[str, int]]:
+        """Return counts per period split by language, publisher or ISBN presence."""
+
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension: {dimension}")
+        prefix = f"{_check_grain(grain)}/{dimension}"
+        periods = self.periods(grain)
+        categories = self._arrays[f"{prefix}/categories"].tolist()
+
+        results: Dict[int, Dict[str, int]] = {}
+        for period_index, category_index, count in zip(
+            self._arrays[f"{prefix}/period_index"].tolist(),
+            self._arrays[f"{prefix}/category_index"].tolist(),
+            self._arrays[f"{prefix}/counts"].tolist(),
+        ):
+            results.setdefault(int(periods[period_index]), {})[categories[category_index]] = count
+        return results
+
+    def missing_isbn(self, grain: str) -> Dict[int, Tuple[int, int, float]]:
+        """Return ``(missing, total, percentage)`` per non-empty period."""
+
+        results: Dict[int, Tuple[int, int, float]] = {}
+        for period, counts in self.breakdown(grain, "isbn").items():
+            missing = counts.get(ISBN_CATEGORIES[0], 0)
+            total = missing + counts.get(ISBN_CATEGORIES[1], 0)
+            results[period] = (missing, total, missing / total if total else 0)
+        return results
+
+    def rolling_average(self, grain: str, window: int) -> Dict[int, float]:
+        """Return the trailing moving average of book counts over ``window`` periods."""
+
+        if window < 1:
+            raise ValueError("Rolling window must be at least 1.")
+        totals = self.totals(grain).astype(np.float64)
+        if len(totals) < window:
+            return {}
+        averages = np.convolve(totals, np.ones(window) / window, mode="valid")
+        return dict(zip(self.periods(grain)[window - 1:].tolist(), averages.tolist()))
+
+    def growth(self, grain: str) -> Dict[int, float]:
+        """Return growth against the same period one year earlier (decade-over-decade for decades).
+
+        Periods whose comparison period has no books are omitted.
+        """
+
+        lag = GROWTH_LAGS[_check_grain(grain)]
+        totals = self.totals(grain).astype(np.float64)
+        if len(totals) <= lag:
+            return {}
+        previous = totals[:-lag]
+        current = totals[lag:]
+        mask = previous > 0
+        rates = (current[mask] - previous[mask]) / previous[mask]
+        return dict(zip(self.periods(grain)[lag:][mask].tolist(), rates.tolist()))
+
+
+class RollupBuilder:
+    """Compute rollups per dataset partition and optionally persist them to disk.
+
+    With a cache directory, one archive is kept per partition (per shard for
+    sharded datasets), so after a change only the affected shards are re-read.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self._cache = PartitionAggregateCache(cache_dir, Rollups.load, self.build)
+
+    def load_or_build(self, repository: BookRepository) -> Rollups:
+        """Combine cached per-partition rollups, rebuilding those whose partition changed."""
+
+        return Rollups.combine(self._cache.collect(repository))
+
+    def build(self, records: Iterable[BookRecord], fingerprint: Optional[str] = None) -> Rollups:
+        """Build rollups from records, tagged with the fingerprint of their partition."""
+
+        years: List[int] = []
+        months: List[int] = []
+        languages: List[str] = []
+        publishers: List[str] = []
+        has_isbn: List[bool] = []
+        for record in records:
+            year, month = extract_year_month(record.publication_date)
+            if year is None:
+                continue
+            years.append(year)
+            months.append(month or 0)
+            languages.append(record.language or "Unknown")
+            publishers.append(record.book_publisher or "Unknown")
+            isbn = record.isbn
+            has_isbn.append(isbn is not None and bool(str(isbn).strip()))
+
+        year_array = np.asarray(years, dtype=np.int64)
+        month_array = np.asarray(months, dtype=np.int64)
+        dimension_codes = {
+            "language": _encode(languages),
+            "publisher": _encode(publishers),
+            "isbn": (np.asarray(ISBN_CATEGORIES), np.asarray(has_isbn, dtype=np.int64)),
+        }
+
+        arrays: Dict[str, np.ndarray] = {}
+        if fingerprint is not None:
+            arrays["fingerprint"] = np.array(fingerprint)
+        for grain in GRAINS:
+            offsets, periods, mask = _period_offsets(grain, year_array, month_array)
+            arrays[f"{grain}/periods"] = periods
+            arrays[f"{grain}/totals"] = np.bincount(offsets, minlength=len(periods)).astype(np.int64)
+            for dimension, (categories, codes) in dimension_codes.items():
+                period_index, category_index, counts = _sparse_counts(offsets, codes[mask], len(categories))
+                prefix = f"{grain}/{dimension}"
+                arrays[f"{prefix}/categories"] = categories
+                arrays[f"{prefix}/period_index"] = period_index
+                arrays[f"{prefix}/category_index"] = category_index
+                arrays[f"{prefix}/counts"] = counts
+
+        return Rollups(arrays)
+
+
+def format_period(grain: str, period: int) -> str:
+    """Format a period label for display."""
+
+    if _check_grain(grain) == "month":
+        return f"{period // 100:04d}-{period % 100:02d}"
+    if grain == "decade":
+        return f"{period}s"
+    return str(period)
+
+
+def _check_grain(grain: str) -> str:
+    if grain not in GRAINS:
+        raise ValueError(f"Unknown rollup grain: {grain}")
+    return grain
+
+
+def _encode(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    categories, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return categories, codes.astype(np.int64).reshape(-1)
+
+
+def _period_offsets(
+    grain: str, years: np.ndarray, months: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Map records to offsets on a contiguous timeline and return the timeline labels."""
+
+    if grain == "month":
+        mask = months > 0
+        keys = years[mask] * 12 + months[mask] - 1
+    else:
+        mask = np.ones(len(years), dtype=bool)
+        keys = years if grain == "year" else years // 10
+
+    if len(keys) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), mask
+
+    start = int(keys.min())
+    timeline = np.arange(start, int(keys.max()) + 1, dtype=np.int64)
+    return keys - start, _period_labels(grain, timeline), mask
+
+
+def _period_labels(grain: str, timeline: np.ndarray) -> np.ndarray:
+    """Convert contiguous timeline keys to period labels."""
+
+    if grain == "month":
+        return (timeline // 12) * 100 + timeline % 12 + 1
+    if grain == "decade":
+        return timeline * 10
+    return timeline
+
+
+def _timeline_keys(grain: str, periods: np.ndarray) -> np.ndarray:
+    """Convert period labels back to contiguous timeline keys."""
+
+    periods = periods.astype(np.int64)
+    if grain == "month":
+        return (periods // 100) * 12 + periods % 100 - 1
+    if grain == "decade":
+        return periods // 10
+    return periods
+
+
+def _sparse_counts(
+    offsets: np.ndarray,
+    codes: np.ndarray,
+    category_count: int,
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count (period, category) pairs, adding ``weights`` instead of ones when given."""
+
+    combined = offsets * max(category_count, 1) + codes
+    keys, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    if weights is not None:
+        counts = np.bincount(inverse.reshape(-1), weights=weights, minlength=len(keys))
+    return (
+        keys // max(category_count, 1),
+        keys % max(category_count, 1),
+        counts.astype(np.int64),
+    )
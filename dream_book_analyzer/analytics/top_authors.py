@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
+from dream_book_analyzer.data.name_normalization import NameNormalizer
 from dream_book_analyzer.domain.models import BookRecord
 
 
 class TopAuthorsAnalyzer:
-    """Identify the most prolific authors in the dataset."""
+    """Identify the most prolific authors in the dataset.
+
+    When a normalizer is given, name variants are counted as one author.
+    """
+
+    def __init__(self, normalizer: Optional[NameNormalizer] = None) -> None:
+        self._normalizer = normalizer
 
     def analyze(self, records: Iterable[BookRecord], limit: int = 5) -> List[Tuple[str, int]]:
         counts: Counter[str] = Counter()
         for record in records:
             author = record.author or "Unknown"
             counts[author] += 1
+        if self._normalizer is not None:
+            counts = self._normalizer.merge_counts(counts)
         return counts.most_common(limit)
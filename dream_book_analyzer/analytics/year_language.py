@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 from typing import Dict, Iterable
 
+from dream_book_analyzer.analytics.rollups import Rollups
 from dream_book_analyzer.domain.models import BookRecord
 from dream_book_analyzer.utils.date_parsing import extract_year
 
@@ -26,3 +27,7 @@ class YearLanguageAnalyzer:
             sorted_counts[year] = dict(year_language_counts[year])
 
         return sorted_counts
+
+    def analyze_rollups(self, rollups: Rollups, grain: str = "year") -> Dict[int, Dict[str, int]]:
+        """Answer the same query from precomputed rollups at month, year or decade grain."""
+        return rollups.breakdown(grain, "language")
@@ -2,39 +2,108 @@
 
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
+from typing import Optional, Sequence
 
+from dream_book_analyzer.analytics.cardinality import CardinalityAnalyzer
+from dream_book_analyzer.analytics.data_quality import DataQualityAnalyzer
 from dream_book_analyzer.analytics.language_distribution import LanguageDistributionAnalyzer
 from dream_book_analyzer.analytics.missing_isbn import MissingIsbnAnalyzer
 from dream_book_analyzer.analytics.publication_trends import PublicationTrendsAnalyzer
 from dream_book_analyzer.analytics.publisher_counts import PublisherCountsAnalyzer
+from dream_book_analyzer.analytics.rollups import RollupBuilder
 from dream_book_analyzer.analytics.top_authors import TopAuthorsAnalyzer
 from dream_book_analyzer.analytics.year_language import YearLanguageAnalyzer
+from dream_book_analyzer.cli.batch import BATCH_ANALYSES, BatchRunner
 from dream_book_analyzer.cli.menu import MenuController
 from dream_book_analyzer.data.csv_repository import CsvBookRepository
+from dream_book_analyzer.data.name_normalization import NameNormalizer
+from dream_book_analyzer.data.repository import BookRepository
+from dream_book_analyzer.data.sharded_csv_repository import ShardedCsvBookRepository
 from dream_book_analyzer.visualization.matplotlib_renderer import MatplotlibChartRenderer
 
 
 DATASET_FILENAME = "Dataset Books.csv"
+SHARD_STATS_FILENAME = "shard_stats.json"
+ROLLUPS_DIRNAME = "rollups"
+CARDINALITY_DIRNAME = "cardinality"
+AUTHOR_ALIASES_FILENAME = "author_aliases.json"
+PUBLISHER_ALIASES_FILENAME = "publisher_aliases.json"
 
 
-def main() -> None:
-    """Bootstrap dependencies and start the CLI menu."""
-    dataset_path = Path(DATASET_FILENAME)
-    repository = CsvBookRepository(dataset_path)
-    output_dir = Path("output")
+def build_repository(
+    dataset: str,
+    output_dir: Path,
+    min_year: Optional[int] = None,
+    max_year: Optional[int] = None,
+) -> BookRepository:
+    """Create a repository for a single CSV file, a directory of shards or a glob pattern."""
 
-    chart_renderer = MatplotlibChartRenderer(output_dir)
+    if ShardedCsvBookRepository.is_sharded_location(dataset):
+        return ShardedCsvBookRepository(
+            dataset,
+            stats_cache_path=output_dir / SHARD_STATS_FILENAME,
+            min_year=min_year,
+            max_year=max_year,
+        )
+    return CsvBookRepository(Path(dataset), min_year=min_year, max_year=max_year)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Dream Book Shop Data Analyzer")
+    parser.add_argument(
+        "--dataset",
+        default=DATASET_FILENAME,
+        help="CSV file, directory of CSV shards, or glob pattern (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-year",
+        type=int,
+        help="only analyze books published in or after this year; shards that cannot match are skipped",
+    )
+    parser.add_argument(
+        "--max-year",
+        type=int,
+        help="only analyze books published in or before this year; shards that cannot match are skipped",
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        choices=BATCH_ANALYSES,
+        metavar="ANALYSIS",
+        help=f"run the named analyses non-interactively and exit (choices: {', '.join(BATCH_ANALYSES)})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Bootstrap dependencies and start the CLI menu or batch mode."""
+    args = parse_args(argv)
+    output_dir = Path("output")
+    repository = build_repository(args.dataset, output_dir, args.min_year, args.max_year)
 
     analyzers = {
         "publication_trends": PublicationTrendsAnalyzer(),
-        "top_authors": TopAuthorsAnalyzer(),
+        "top_authors": TopAuthorsAnalyzer(NameNormalizer("person", output_dir / AUTHOR_ALIASES_FILENAME)),
         "language_distribution": LanguageDistributionAnalyzer(),
-        "publisher_counts": PublisherCountsAnalyzer(),
+        "publisher_counts": PublisherCountsAnalyzer(
+            NameNormalizer("publisher", output_dir / PUBLISHER_ALIASES_FILENAME)
+        ),
         "missing_isbn": MissingIsbnAnalyzer(),
         "year_language": YearLanguageAnalyzer(),
+        "data_quality": DataQualityAnalyzer(),
+        "cardinality": CardinalityAnalyzer(cache_dir=output_dir / CARDINALITY_DIRNAME),
+        "rollups": RollupBuilder(output_dir / ROLLUPS_DIRNAME),
     }
 
+    if args.batch:
+        BatchRunner(repository, analyzers).run(args.batch)
+        return
+
+    chart_renderer = MatplotlibChartRenderer(output_dir)
     menu = MenuController(repository, analyzers, chart_renderer)
     menu.run()
 
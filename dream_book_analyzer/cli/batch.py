@@ -0,0 +1,53 @@
+"""Non-interactive batch mode for running analyses."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable
+
+from dream_book_analyzer.analytics.cardinality import CardinalityAnalyzer
+from dream_book_analyzer.analytics.data_quality import DataQualityAnalyzer
+from dream_book_analyzer.cli.reports import format_cardinality_report, format_data_quality_report
+from dream_book_analyzer.data.repository import BookRepository
+
+BATCH_ANALYSES = ("data_quality", "cardinality")
+
+
+class BatchRunner:
+    """Run named analyses over a streamed dataset and print their reports."""
+
+    def __init__(self, repository: BookRepository, analyzers: Dict[str, object]) -> None:
+        self._repository = repository
+        self._analyzers = analyzers
+
+        self._batch_actions: Dict[str, Callable[[], None]] = {
+            "data_quality": self._data_quality,
+            "cardinality": self._cardinality,
+        }
+
+    @property
+    def available(self) -> Iterable[str]:
+        """Names of the analyses that can run in batch mode."""
+        return self._batch_actions.keys()
+
+    def run(self, names: Iterable[str]) -> None:
+        """Run each named analysis in order, after checking that every name is known."""
+        names = list(names)
+        unknown = [name for name in names if name not in self._batch_actions]
+        if unknown:
+            raise ValueError(
+                f"Unknown batch analysis: {', '.join(unknown)}. Choose from: {', '.join(self.available)}"
+            )
+        for name in names:
+            self._batch_actions[name]()
+
+    def _data_quality(self) -> None:
+        analyzer: DataQualityAnalyzer = self._analyzers["data_quality"]
+        report = analyzer.analyze(self._repository.iter_books())
+        print("\nData Quality Analysis")
+        print(format_data_quality_report(report))
+
+    def _cardinality(self) -> None:
+        analyzer: CardinalityAnalyzer = self._analyzers["cardinality"]
+        statistics = analyzer.analyze_repository(self._repository)
+        print("\nDistinct Authors, Publishers and Languages")
+        print(format_cardinality_report(statistics))
@@ -5,18 +5,26 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
+from dream_book_analyzer.analytics.cardinality import CardinalityAnalyzer
+from dream_book_analyzer.analytics.data_quality import DataQualityAnalyzer
 from dream_book_analyzer.analytics.language_distribution import LanguageDistributionAnalyzer
 from dream_book_analyzer.analytics.missing_isbn import MissingIsbnAnalyzer
 from dream_book_analyzer.analytics.publication_trends import PublicationTrendsAnalyzer
 from dream_book_analyzer.analytics.publisher_counts import PublisherCountsAnalyzer
+from dream_book_analyzer.analytics.rollups import GRAINS, RollupBuilder, Rollups, format_period
 from dream_book_analyzer.analytics.top_authors import TopAuthorsAnalyzer
 from dream_book_analyzer.analytics.year_language import YearLanguageAnalyzer
+from dream_book_analyzer.cli.reports import format_cardinality_report, format_data_quality_report
 from dream_book_analyzer.data.repository import BookRepository
 from dream_book_analyzer.domain.models import BookRecord
 from dream_book_analyzer.utils.formatting import format_percentage, format_table
 from dream_book_analyzer.visualization.chart_renderer import ChartRenderer
 
 
+# Trailing window, in periods, used for the rolling average at each granularity.
+ROLLING_WINDOWS = {"month": 12, "year": 5, "decade": 3}
+
+
 class MenuController:
     """Command-line menu controller."""
 
@@ -29,7 +37,11 @@ class MenuController:
         self._repository = repository
         self._chart_renderer = chart_renderer
         self._analyzers = analyzers
-        self._records = self._repository.list_books()
+        self._loaded_records: Optional[List[BookRecord]] = None
+        rollup_builder: Optional[RollupBuilder] = self._analyzers.get("rollups")
+        self._rollups: Optional[Rollups] = None
+        if rollup_builder is not None:
+            self._rollups = rollup_builder.load_or_build(self._repository)
 
         self._menu_actions: Dict[str, Callable[[], None]] = {
             "1": self._publication_trends,
@@ -38,8 +50,18 @@ class MenuController:
             "4": self._publisher_counts,
             "5": self._missing_isbn,
             "6": self._year_language,
+            "7": self._granular_trends,
+            "8": self._data_quality,
+            "9": self._cardinality,
         }
 
+    @property
+    def _records(self) -> List[BookRecord]:
+        """Raw records, loaded on first use so rollup-backed queries never read them."""
+        if self._loaded_records is None:
+            self._loaded_records = self._repository.list_books()
+        return self._loaded_records
+
     def run(self) -> None:
         """Start the CLI loop."""
         while True:
@@ -50,6 +72,9 @@ class MenuController:
             print("4) Number of books published by each publisher")
             print("5) Missing ISBN Analysis")
             print("6) Number of books per year categorized by language")
+            print("7) Trends by month/year/decade with rolling average and growth")
+            print("8) Data Quality: ISBN checksums and duplicate records")
+            print("9) Distinct authors, publishers and languages (approximate)")
             print("0) Exit")
 
             choice = input("Select an option: ").strip()
@@ -77,7 +102,10 @@ class MenuController:
 
     def _publication_trends(self) -> None:
         analyzer: PublicationTrendsAnalyzer = self._analyzers["publication_trends"]
-        results = analyzer.analyze(self._records)
+        if self._rollups is not None:
+            results = analyzer.analyze_rollups(self._rollups)
+        else:
+            results = analyzer.analyze(self._records)
         if not results:
             print("No valid publication years found.")
             return
@@ -203,7 +231,10 @@ class MenuController:
 
     def _year_language(self) -> None:
         analyzer: YearLanguageAnalyzer = self._analyzers["year_language"]
-        results = analyzer.analyze(self._records)
+        if self._rollups is not None:
+            results = analyzer.analyze_rollups(self._rollups)
+        else:
+            results = analyzer.analyze(self._records)
         if not results:
             print("No valid publication years found for language breakdown.")
             return
@@ -248,6 +279,123 @@ class MenuController:
                         y_label="Books",
                     )
 
+    def _granular_trends(self) -> None:
+        if self._rollups is None:
+            print("Rollups are not available.")
+            return
+
+        grain = input(f"Select granularity ({'/'.join(GRAINS)}): ").strip().lower()
+        if grain not in GRAINS:
+            print("Invalid granularity selected.")
+            return
+
+        analyzer: PublicationTrendsAnalyzer = self._analyzers["publication_trends"]
+        missing_analyzer: MissingIsbnAnalyzer = self._analyzers["missing_isbn"]
+        results = analyzer.analyze_rollups(self._rollups, grain)
+        if not results:
+            print(f"No publication dates with {grain} precision found.")
+            return
+
+        window = ROLLING_WINDOWS[grain]
+        averages = self._rollups.rolling_average(grain, window)
+        growth = self._rollups.growth(grain)
+        missing = missing_analyzer.analyze_rollups(self._rollups, grain)
+
+        rows = []
+        for period, count in results.items():
+            average = averages.get(period)
+            rate = growth.get(period)
+            rows.append(
+                (
+                    format_period(grain, period),
+                    str(count),
+                    "-" if average is None else f"{average:.2f}",
+                    "-" if rate is None else format_percentage(rate),
+                    format_percentage(missing[period][2]),
+                )
+            )
+
+        title = f"Publication Trends by {grain.capitalize()}"
+        print(f"\n{title}")
+        print(format_table(["Period", "Books", f"Rolling Avg ({window})", "Growth", "Missing ISBN"], rows))
+
+        if self._prompt_chart_generation():
+            chart_type = self._prompt_chart_type(["bar", "line"])
+            if chart_type:
+                self._render_single_series_chart(
+                    chart_type,
+                    title,
+                    [format_period(grain, period) for period in results.keys()],
+                    list(results.values()),
+                    Path(f"publication_trends_{grain}.png"),
+                    x_label=grain.capitalize(),
+                    y_label="Books Published",
+                )
+
+    def _data_quality(self) -> None:
+        analyzer: DataQualityAnalyzer = self._analyzers["data_quality"]
+        records = self._loaded_records if self._loaded_records is not None else self._repository.iter_books()
+        report = analyzer.analyze(records)
+
+        print("\nData Quality Analysis")
+        print(format_data_quality_report(report))
+
+        if self._prompt_chart_generation():
+            chart_type = self._prompt_chart_type(["bar", "pie"])
+            if chart_type:
+                labels = ["Valid ISBN-10", "Valid ISBN-13", "Bad Checksum", "Malformed ISBN", "Missing ISBN"]
+                values = [
+                    report.valid_isbn10,
+                    report.valid_isbn13,
+                    report.invalid_checksum,
+                    report.malformed_isbn,
+                    report.missing_isbn,
+                ]
+                self._render_single_series_chart(
+                    chart_type,
+                    "ISBN Data Quality",
+                    labels,
+                    values,
+                    Path("data_quality.png"),
+                    x_label="Status",
+                    y_label="Books",
+                )
+
+    def _cardinality(self) -> None:
+        analyzer: CardinalityAnalyzer = self._analyzers["cardinality"]
+        statistics = analyzer.analyze_repository(self._repository)
+
+        print("\nDistinct Authors, Publishers and Languages")
+        print(format_cardinality_report(statistics))
+
+        yearly = statistics.yearly_counts()
+        if yearly and self._prompt_chart_generation():
+            chart_type = self._prompt_chart_type(["bar", "line"])
+            if chart_type:
+                years = [str(year) for year in yearly]
+                series = [
+                    (dimension.capitalize(), [counts[dimension] for counts in yearly.values()])
+                    for dimension in ("authors", "publishers")
+                ]
+                if chart_type == "bar":
+                    self._chart_renderer.render_multi_series_bar(
+                        "Distinct Authors and Publishers per Year",
+                        years,
+                        series,
+                        Path("cardinality_bar.png"),
+                        x_label="Year",
+                        y_label="Distinct Count",
+                    )
+                elif chart_type == "line":
+                    self._chart_renderer.render_multi_series_line(
+                        "Distinct Authors and Publishers per Year",
+                        years,
+                        series,
+                        Path("cardinality_line.png"),
+                        x_label="Year",
+                        y_label="Distinct Count",
+                    )
+
     def _render_single_series_chart(
         self,
         chart_type: str,
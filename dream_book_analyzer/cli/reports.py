@@ -0,0 +1,61 @@
+"""Console report formatting shared by the menu and batch mode."""
+
+from __future__ import annotations
+
+from dream_book_analyzer.analytics.cardinality import DIMENSIONS, CardinalityStatistics
+from dream_book_analyzer.analytics.data_quality import DataQualityReport, DuplicateSummary
+from dream_book_analyzer.utils.formatting import format_percentage, format_table
+
+
+def format_data_quality_report(report: DataQualityReport) -> str:
+    """Render the data quality report as console text."""
+
+    present = report.total - report.missing_isbn
+    rows = [
+        ("Total Records", str(report.total), ""),
+        ("Missing ISBN", str(report.missing_isbn), _share(report.missing_isbn, report.total)),
+        ("Valid ISBN-10", str(report.valid_isbn10), _share(report.valid_isbn10, present)),
+        ("Valid ISBN-13", str(report.valid_isbn13), _share(report.valid_isbn13, present)),
+        ("Bad Checksum", str(report.invalid_checksum), _share(report.invalid_checksum, present)),
+        ("Malformed ISBN", str(report.malformed_isbn), _share(report.malformed_isbn, present)),
+    ]
+    lines = [format_table(["Check", "Records", "Share"], rows)]
+
+    if report.invalid_examples:
+        lines.append("\nInvalid ISBN examples: " + ", ".join(report.invalid_examples))
+
+    lines.append(_format_duplicates("ISBN", report.isbn_duplicates))
+    lines.append(_format_duplicates("BNB id", report.bnb_duplicates))
+    return "\n".join(lines)
+
+
+def format_cardinality_report(statistics: CardinalityStatistics) -> str:
+    """Render approximate distinct counts, overall and per year, as console text."""
+
+    headers = ["Scope", *(dimension.capitalize() for dimension in DIMENSIONS)]
+    overall = statistics.overall_counts()
+    rows = [("Overall", *(str(overall[dimension]) for dimension in DIMENSIONS))]
+    for year, counts in statistics.yearly_counts().items():
+        rows.append((str(year), *(str(counts[dimension]) for dimension in DIMENSIONS)))
+
+    return (
+        format_table(headers, rows)
+        + f"\n\nEstimates are approximate (standard error {format_percentage(statistics.standard_error)})."
+        + "\nNames are counted by canonical key, so fuzzy aliases merged in the author and"
+        + "\npublisher rankings (for example initials-only variants) are counted separately here."
+    )
+
+
+def _format_duplicates(label: str, summary: DuplicateSummary) -> str:
+    text = (
+        f"\nDuplicate {label}s: {summary.duplicate_keys} values "
+        f"repeated across {summary.duplicate_rows} extra records"
+    )
+    if summary.examples:
+        rows = [(key, str(count)) for key, count in summary.examples]
+        text += "\n" + format_table([label, "Records"], rows)
+    return text
+
+
+def _share(count: int, total: int) -> str:
+    return format_percentage(count / total if total else 0)
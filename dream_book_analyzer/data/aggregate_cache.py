@@ -0,0 +1,94 @@
+"""Per-partition persistence for mergeable aggregates."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+from pathlib import Path
+from typing import Callable, Generic, Iterable, List, Optional, Protocol, TypeVar
+
+from dream_book_analyzer.data.repository import BookRepository, DataPartition
+from dream_book_analyzer.domain.models import BookRecord
+
+
+class PartitionAggregate(Protocol):
+    """An aggregate that remembers the partition fingerprint it was built from."""
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        ...
+
+    def save(self, path: Path) -> None:
+        ...
+
+
+AggregateT = TypeVar("AggregateT", bound=PartitionAggregate)
+
+# Errors that mean a cache file is missing, truncated or from an older format.
+CACHE_READ_ERRORS = (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile)
+
+
+class PartitionAggregateCache(Generic[AggregateT]):
+    """Keep one aggregate per dataset partition on disk and rebuild only stale ones.
+
+    Aggregates are reused while the partition fingerprint (for shards, their
+    size and mtime) is unchanged. Stale partitions are read through
+    :meth:`BookRepository.read_partitions`, which may read them concurrently.
+    The caller merges the returned aggregates, which must therefore combine by
+    sums or maxima.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path],
+        load: Callable[[Path], AggregateT],
+        build: Callable[[Iterable[BookRecord], Optional[str]], AggregateT],
+    ) -> None:
+        self._directory = directory
+        self._load = load
+        self._build = build
+
+    def collect(self, repository: BookRepository) -> List[AggregateT]:
+        """Return one aggregate per partition of the repository."""
+
+        aggregates: List[AggregateT] = []
+        stale: List[DataPartition] = []
+        for partition in repository.partitions():
+            cached = self._load_cached(partition)
+            if cached is None:
+                stale.append(partition)
+            else:
+                aggregates.append(cached)
+
+        if stale:
+            for partition, records in repository.read_partitions(stale):
+                aggregate = self._build(records, partition.fingerprint)
+                self._store(partition, aggregate)
+                aggregates.append(aggregate)
+        return aggregates
+
+    def _path(self, partition: DataPartition) -> Optional[Path]:
+        if self._directory is None:
+            return None
+        digest = hashlib.sha256(partition.key.encode("utf-8")).hexdigest()[:32]
+        return self._directory / f"{digest}.npz"
+
+    def _load_cached(self, partition: DataPartition) -> Optional[AggregateT]:
+        path = self._path(partition)
+        if partition.fingerprint is None or path is None or not path.exists():
+            return None
+        try:
+            aggregate = self._load(path)
+        except CACHE_READ_ERRORS:
+            return None
+        return aggregate if aggregate.fingerprint == partition.fingerprint else None
+
+    def _store(self, partition: DataPartition, aggregate: AggregateT) -> None:
+        path = self._path(partition)
+        if partition.fingerprint is None or path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        aggregate.save(temporary)
+        os.replace(temporary, path)
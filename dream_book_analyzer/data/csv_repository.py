@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
 import pandas as pd
 
-from dream_book_analyzer.data.repository import BookRepository
+from dream_book_analyzer.data.repository import BookRepository, DataPartition
 from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.date_parsing import extract_year, year_in_range
 
 
 class CsvBookRepository(BookRepository):
-    """Loads book records from a CSV file."""
+    """Loads book records from a CSV file.
+
+    When a year bound is given, only records with a publication year in the
+    range are returned.
+    """
 
     REQUIRED_COLUMNS = {
         "book",
@@ -24,32 +30,84 @@ class CsvBookRepository(BookRepository):
         "BNB id",
     }
 
-    def __init__(self, file_path: Path) -> None:
+    # Identifiers must stay text: numeric parsing drops ISBN leading zeros.
+    COLUMN_DTYPES = {"ISBN": str, "BNB id": str}
+
+    def __init__(
+        self,
+        file_path: Path,
+        chunk_size: int = 100_000,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+    ) -> None:
         self._file_path = file_path
+        self._chunk_size = chunk_size
+        self._min_year = min_year
+        self._max_year = max_year
 
     def list_books(self) -> List[BookRecord]:
+        self._require_file()
+        dataframe = pd.read_csv(self._file_path, dtype=self.COLUMN_DTYPES)
+        validate_columns(dataframe, self.REQUIRED_COLUMNS)
+        return self._filter(dataframe_to_records(dataframe))
+
+    def iter_books(self) -> Iterator[BookRecord]:
+        self._require_file()
+        with pd.read_csv(self._file_path, dtype=self.COLUMN_DTYPES, chunksize=self._chunk_size) as reader:
+            for dataframe in reader:
+                validate_columns(dataframe, self.REQUIRED_COLUMNS)
+                yield from self._filter(dataframe_to_records(dataframe))
+
+    def partitions(self) -> List[DataPartition]:
+        self._require_file()
+        stat = self._file_path.stat()
+        return [
+            DataPartition(
+                key=json.dumps([str(self._file_path.resolve()), self._min_year, self._max_year]),
+                fingerprint=json.dumps([stat.st_size, stat.st_mtime_ns]),
+            )
+        ]
+
+    def _filter(self, records: List[BookRecord]) -> List[BookRecord]:
+        if self._min_year is None and self._max_year is None:
+            return records
+        return [
+            record
+            for record in records
+            if year_in_range(extract_year(record.publication_date), self._min_year, self._max_year)
+        ]
+
+    def _require_file(self) -> None:
         if not self._file_path.exists():
             raise FileNotFoundError(
-                f"Dataset file not found: {self._file_path}. Ensure 'Dataset Books.csv' is present."
+                f"Dataset file not found: {self._file_path}. Pass an existing CSV file, directory or glob "
+                "with --dataset."
             )
 
-        dataframe = pd.read_csv(self._file_path)
-        missing_columns = self.REQUIRED_COLUMNS.difference(dataframe.columns)
-        if missing_columns:
-            missing_list = ", ".join(sorted(missing_columns))
-            raise ValueError(f"Missing required columns in dataset: {missing_list}")
-
-        records: List[BookRecord] = []
-        for _, row in dataframe.iterrows():
-            record = BookRecord(
-                book=str(row.get("book", "")).strip(),
-                author=str(row.get("author", "")).strip(),
-                publication_date=str(row.get("publication date", "")).strip(),
-                language=str(row.get("language", "")).strip(),
-                book_publisher=str(row.get("book publisher", "")).strip(),
-                isbn=None if pd.isna(row.get("ISBN")) else str(row.get("ISBN")).strip(),
-                bnb_id=str(row.get("BNB id", "")).strip(),
-            )
-            records.append(record)
 
-        return records
+def validate_columns(dataframe: pd.DataFrame, required_columns: Iterable[str]) -> None:
+    """Raise a ValueError when the dataframe lacks any of the required columns."""
+
+    missing_columns = set(required_columns).difference(dataframe.columns)
+    if missing_columns:
+        missing_list = ", ".join(sorted(missing_columns))
+        raise ValueError(f"Missing required columns in dataset: {missing_list}")
+
+
+def dataframe_to_records(dataframe: pd.DataFrame) -> List[BookRecord]:
+    """Convert a dataset dataframe into book records."""
+
+    records: List[BookRecord] = []
+    for _, row in dataframe.iterrows():
+        record = BookRecord(
+            book=str(row.get("book", "")).strip(),
+            author=str(row.get("author", "")).strip(),
+            publication_date=str(row.get("publication date", "")).strip(),
+            language=str(row.get("language", "")).strip(),
+            book_publisher=str(row.get("book publisher", "")).strip(),
+            isbn=None if pd.isna(row.get("ISBN")) else str(row.get("ISBN")).strip(),
+            bnb_id=str(row.get("BNB id", "")).strip(),
+        )
+        records.append(record)
+
+    return records
@@ -0,0 +1,280 @@
+"""Canonical keys and alias resolution for author and publisher names."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+NON_WORD_PATTERN = re.compile(r"[^\w\s,]|_")
+DIGIT_PATTERN = re.compile(r"\d")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Bump whenever the key functions change so cached alias maps are rebuilt.
+NORMALIZATION_VERSION = 2
+
+PUBLISHER_STOPWORDS = {
+    "the",
+    "and",
+    "ltd",
+    "limited",
+    "inc",
+    "incorporated",
+    "co",
+    "company",
+    "corp",
+    "corporation",
+    "plc",
+    "llc",
+}
+
+
+def _fold(name: str) -> str:
+    """Lowercase, strip accents and replace punctuation with spaces."""
+
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+    text = NON_WORD_PATTERN.sub(" ", text.replace("&", " and "))
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def canonical_person_key(name: str) -> str:
+    """Return a ``"surname given names"`` key for a person name.
+
+    Both ``"Smith, John"`` and ``"John Smith"`` map to ``"smith john"``, and
+    ``"SMITH, J."`` maps to ``"smith j"``. Life dates such as ``"1950-"`` are
+    dropped.
+    """
+
+    folded = _fold(DIGIT_PATTERN.sub(" ", name))
+    if "," in folded:
+        surname, _, given = folded.partition(",")
+        surname_tokens = surname.split()
+        given_tokens = given.replace(",", " ").split()
+    else:
+        tokens = folded.split()
+        surname_tokens = tokens[-1:]
+        given_tokens = tokens[:-1]
+    return " ".join(surname_tokens + given_tokens)
+
+
+def canonical_publisher_key(name: str) -> str:
+    """Return a key for a publisher name with punctuation and legal suffixes removed."""
+
+    tokens = [token for token in _fold(name).replace(",", " ").split() if token not in PUBLISHER_STOPWORDS]
+    return " ".join(tokens)
+
+
+def _jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class NameNormalizer:
+    """Resolve name variants to canonical entities.
+
+    Names are first grouped by an exact canonical key; names whose key is
+    empty are left as they are. Near-duplicate keys are found with a
+    sorted-neighbourhood blocking index: each key is compared only with the
+    ``window`` keys on either side of it in sorted order. For people,
+    initials-only variants are also merged into the single full name they
+    abbreviate within a ``surname + first initial`` block.
+
+    The key-to-cluster map is persisted and grows incrementally: on later runs
+    only keys that were never seen before are compared with their neighbours,
+    so existing clusters are kept and can only grow. The map is discarded when
+    the normalization settings change.
+    """
+
+    KEY_FUNCTIONS: Dict[str, Callable[[str], str]] = {
+        "person": canonical_person_key,
+        "publisher": canonical_publisher_key,
+    }
+
+    def __init__(
+        self,
+        kind: str,
+        cache_path: Optional[Path] = None,
+        window: int = 5,
+        threshold: float = 0.8,
+    ) -> None:
+        if kind not in self.KEY_FUNCTIONS:
+            raise ValueError(f"Unknown name kind: {kind}")
+        self._kind = kind
+        self._key_function = self.KEY_FUNCTIONS[kind]
+        self._cache_path = cache_path
+        self._window = window
+        self._threshold = threshold
+        self._settings = self._settings_fingerprint()
+        self._parents: Dict[str, str] = {}
+        self._load_cache()
+
+    def merge_counts(self, counts: Mapping[str, int]) -> Counter[str]:
+        """Combine counts of name variants under their canonical display names."""
+
+        aliases = self.resolve(counts)
+        merged: Counter[str] = Counter()
+        for name, count in counts.items():
+            merged[aliases.get(name, name)] += count
+        return merged
+
+    def resolve(self, counts: Mapping[str, int]) -> Dict[str, str]:
+        """Return the alias map from each name to its canonical display name.
+
+        The most frequent variant of each entity among the given names is used
+        as its display name.
+        """
+
+        names_by_key: Dict[str, List[str]] = defaultdict(list)
+        aliases: Dict[str, str] = {}
+        for name in counts:
+            key = self._key_function(name)
+            if key:
+                names_by_key[key].append(name)
+            else:
+                aliases[name] = name
+
+        new_keys = [key for key in names_by_key if key not in self._parents]
+        if new_keys:
+            self._add_keys(new_keys)
+            self._save_cache()
+
+        clusters: Dict[str, List[str]] = defaultdict(list)
+        for key, names in names_by_key.items():
+            clusters[_find(self._parents, key)].extend(names)
+
+        for names in clusters.values():
+            display = max(names, key=lambda name: (counts[name], name))
+            for name in names:
+                aliases[name] = display
+        return aliases
+
+    def _settings_fingerprint(self) -> str:
+        """Hash every setting that affects which keys are merged."""
+
+        settings = [
+            NORMALIZATION_VERSION,
+            self._kind,
+            self._window,
+            self._threshold,
+            sorted(PUBLISHER_STOPWORDS) if self._kind == "publisher" else [],
+        ]
+        return hashlib.sha256(json.dumps(settings).encode("utf-8")).hexdigest()
+
+    def _add_keys(self, new_keys: List[str]) -> None:
+        """Add unseen keys and merge them with matching keys, old or new."""
+
+        for key in new_keys:
+            self._parents[key] = key
+        ordered = sorted(self._parents)
+        for left, right in self._neighbour_pairs(ordered, new_keys):
+            _union(self._parents, left, right)
+        if self._kind == "person":
+            blocks = {_initial_block(key) for key in new_keys} - {None}
+            for left, right in _initial_pairs([key for key in ordered if _initial_block(key) in blocks]):
+                _union(self._parents, left, right)
+
+    def _neighbour_pairs(self, ordered: List[str], new_keys: List[str]) -> Iterable[Tuple[str, str]]:
+        """Pair each new key with similar keys among its ``window`` neighbours on either side.
+
+        Preceding new keys are skipped because they already compared forward
+        with this key, so a run without a cache does a single forward pass.
+        """
+
+        fresh = set(new_keys)
+        grams: Dict[str, Set[str]] = {}
+
+        def trigrams_of(key: str) -> Set[str]:
+            if key not in grams:
+                grams[key] = _trigrams(key)
+            return grams[key]
+
+        for key in new_keys:
+            index = bisect.bisect_left(ordered, key)
+            key_grams = trigrams_of(key)
+            preceding = [other for other in ordered[max(0, index - self._window):index] if other not in fresh]
+            for other in preceding + ordered[index + 1:index + 1 + self._window]:
+                other_grams = trigrams_of(other)
+                # Jaccard similarity can never exceed the ratio of the set sizes.
+                smaller, larger = sorted((len(key_grams), len(other_grams)))
+                if smaller < self._threshold * larger:
+                    continue
+                if _jaccard(key_grams, other_grams) >= self._threshold:
+                    yield key, other
+
+    def _load_cache(self) -> None:
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return
+        if not isinstance(payload, dict) or payload.get("settings") != self._settings:
+            return
+        parents = payload.get("parents")
+        if isinstance(parents, dict) and all(parent in parents for parent in parents.values()):
+            self._parents = dict(parents)
+
+    def _save_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        parents = {key: _find(self._parents, key) for key in sorted(self._parents)}
+        payload = {"kind": self._kind, "settings": self._settings, "parents": parents}
+        self._cache_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _initial_pairs(keys: List[str]) -> Iterable[Tuple[str, str]]:
+    """Pair initials-only person keys with the single full name they abbreviate."""
+
+    blocks: Dict[Tuple[str, str], List[Tuple[str, List[str]]]] = defaultdict(list)
+    for key in keys:
+        block = _initial_block(key)
+        if block is not None:
+            blocks[block].append((key, key.partition(" ")[2].split()))
+
+    for entries in blocks.values():
+        full_names = [(key, tokens) for key, tokens in entries if len(tokens[0]) > 1]
+        for key, tokens in entries:
+            if any(len(token) > 1 for token in tokens):
+                continue
+            matches = [
+                full_key
+                for full_key, full_tokens in full_names
+                if [token[0] for token in full_tokens[:len(tokens)]] == tokens
+            ]
+            if len(matches) == 1:
+                yield key, matches[0]
+
+
+def _initial_block(key: str) -> Optional[Tuple[str, str]]:
+    """Return the ``(surname, first initial)`` block of a person key, if it has a given name."""
+
+    surname, _, given = key.partition(" ")
+    given_tokens = given.split()
+    return (surname, given_tokens[0][0]) if given_tokens else None
+
+
+def _find(parents: Dict[str, str], key: str) -> str:
+    while parents[key] != key:
+        parents[key] = parents[parents[key]]
+        key = parents[key]
+    return key
+
+
+def _union(parents: Dict[str, str], left: str, right: str) -> None:
+    left_root = _find(parents, left)
+    right_root = _find(parents, right)
+    if left_root != right_root:
+        parents[max(left_root, right_root)] = min(left_root, right_root)
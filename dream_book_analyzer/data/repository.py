@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from dream_book_analyzer.domain.models import BookRecord
 
 
+@dataclass(frozen=True)
+class DataPartition:
+    """An independently readable slice of the dataset, such as one CSV shard.
+
+    ``key`` identifies the slice across runs and ``fingerprint`` changes
+    whenever its content changes. A ``None`` fingerprint means aggregates of
+    the slice must never be reused.
+    """
+
+    key: str
+    fingerprint: Optional[str]
+
+
 class BookRepository(ABC):
     """Abstract repository interface for book data."""
 
@@ -15,3 +29,25 @@ class BookRepository(ABC):
     def list_books(self) -> List[BookRecord]:
         """Return all book records from the data source."""
         raise NotImplementedError
+
+    def iter_books(self) -> Iterator[BookRecord]:
+        """Yield book records one at a time.
+
+        Repositories that can stream their source override this to avoid
+        materializing the full dataset.
+        """
+        yield from self.list_books()
+
+    def partitions(self) -> List[DataPartition]:
+        """Return the slices of the dataset that aggregates can be cached for.
+
+        By default the whole dataset is a single partition that is never reused.
+        """
+        return [DataPartition(key="dataset", fingerprint=None)]
+
+    def read_partitions(
+        self, partitions: Sequence[DataPartition]
+    ) -> Iterator[Tuple[DataPartition, Iterable[BookRecord]]]:
+        """Yield each requested partition together with its records."""
+        for partition in partitions:
+            yield partition, self.iter_books()
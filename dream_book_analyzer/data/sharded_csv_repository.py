@@ -0,0 +1,290 @@
+"""Repository implementation for datasets split across many CSV shards."""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from dream_book_analyzer.data.csv_repository import CsvBookRepository, dataframe_to_records, validate_columns
+from dream_book_analyzer.data.repository import BookRepository, DataPartition
+from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.date_parsing import extract_year, year_in_range
+
+GLOB_CHARACTERS = set("*?[")
+
+
+@dataclass(frozen=True)
+class ShardStats:
+    """Per-shard statistics used for pruning and change detection."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    row_count: int
+    min_year: Optional[int]
+    max_year: Optional[int]
+    partitions: Dict[str, str] = field(default_factory=dict)
+
+    def matches_file(self, path: Path) -> bool:
+        """Return True when the shard file is unchanged since these stats were taken."""
+
+        stat = path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+@dataclass
+class _LoadedShard:
+    stats: ShardStats
+    records: List[BookRecord]
+    years: List[Optional[int]]
+
+
+class ShardedCsvBookRepository(BookRepository):
+    """Loads book records from a glob pattern or a directory of CSV shards.
+
+    Directories named ``key=value`` (for example ``year=1998/``) are treated as
+    partitions. When a year range is configured, shards whose partition values
+    or persisted statistics rule it out are skipped without being opened, and
+    only records with a publication year in the range are returned. Within a
+    session, shards that have not changed since the last read are served from
+    memory.
+    """
+
+    def __init__(
+        self,
+        location: str | Path,
+        max_workers: Optional[int] = None,
+        stats_cache_path: Optional[Path] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+    ) -> None:
+        self._location = str(location)
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._stats_cache_path = stats_cache_path
+        self._min_year = min_year
+        self._max_year = max_year
+        self._loaded: Dict[str, _LoadedShard] = {}
+        self._stats: Dict[str, ShardStats] = self._load_stats_cache()
+
+    @staticmethod
+    def is_sharded_location(location: str | Path) -> bool:
+        """Return True when the location is a directory or a glob pattern.
+
+        An existing file is never treated as a pattern, even if its name
+        contains glob characters such as ``[``.
+        """
+
+        path = Path(location)
+        if path.is_file():
+            return False
+        return path.is_dir() or any(char in GLOB_CHARACTERS for char in str(location))
+
+    def discover_shards(self) -> List[Path]:
+        """Return the sorted list of shard files for the configured location."""
+
+        root = Path(self._location)
+        if root.is_dir():
+            paths = root.rglob("*.csv")
+        else:
+            paths = (Path(match) for match in glob.glob(self._location, recursive=True))
+        return sorted(path for path in paths if path.is_file())
+
+    def partition_values(self, path: Path) -> Dict[str, str]:
+        """Extract ``key=value`` partition values from the directories of a shard path."""
+
+        partitions: Dict[str, str] = {}
+        for part in path.parent.parts:
+            key, separator, value = part.partition("=")
+            if separator and key:
+                partitions[key] = value
+        return partitions
+
+    def shard_stats(self) -> List[ShardStats]:
+        """Return statistics for every shard, reading only shards that changed."""
+
+        shards = self._require_shards()
+        self._load_shards([shard for shard in shards if self._fresh_stats(shard) is None])
+        return [self._fresh_stats(shard) for shard in shards]
+
+    def list_books(self) -> List[BookRecord]:
+        """Return records from every shard that can match the configured year range."""
+
+        shards = self._matching_shards()
+        self._load_shards(shards)
+
+        records: List[BookRecord] = []
+        for shard in shards:
+            records.extend(self._filter(self._loaded[str(shard)]))
+        return records
+
+    def iter_books(self) -> Iterator[BookRecord]:
+        """Yield records shard by shard without adding them to the per-shard cache.
+
+        Shards are read concurrently, but at most ``max_workers`` shards are
+        held in memory ahead of the consumer.
+        """
+
+        for loaded in self._stream_shards(self._matching_shards()):
+            yield from self._filter(loaded)
+
+    def partitions(self) -> List[DataPartition]:
+        """Return one partition per shard that can match the configured year range."""
+
+        partitions = []
+        for shard in self._matching_shards():
+            stat = shard.stat()
+            partitions.append(
+                DataPartition(
+                    key=json.dumps([str(shard.resolve()), self._min_year, self._max_year]),
+                    fingerprint=json.dumps([stat.st_size, stat.st_mtime_ns]),
+                )
+            )
+        return partitions
+
+    def read_partitions(
+        self, partitions: Sequence[DataPartition]
+    ) -> Iterator[Tuple[DataPartition, Iterable[BookRecord]]]:
+        """Read the requested shards concurrently and yield their filtered records."""
+
+        by_path = {json.loads(partition.key)[0]: partition for partition in partitions}
+        shards = [Path(path) for path in by_path]
+        for loaded in self._stream_shards(shards):
+            yield by_path[str(Path(loaded.stats.path).resolve())], self._filter(loaded)
+
+    def _stream_shards(self, shards: Sequence[Path]) -> Iterator[_LoadedShard]:
+        """Read shards on the thread pool, holding at most ``max_workers`` ahead of the consumer."""
+
+        pending: Deque[Future] = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                try:
+                    for shard in shards:
+                        if self._is_loaded(shard):
+                            pending.append(_completed(self._loaded[str(shard)]))
+                        else:
+                            pending.append(executor.submit(self._read_shard, shard))
+                        if len(pending) >= self._max_workers:
+                            yield self._take(pending)
+                    while pending:
+                        yield self._take(pending)
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            self._save_stats_cache()
+
+    def _take(self, pending: Deque[Future]) -> _LoadedShard:
+        loaded: _LoadedShard = pending.popleft().result()
+        self._stats[loaded.stats.path] = loaded.stats
+        return loaded
+
+    def _filter(self, loaded: _LoadedShard) -> List[BookRecord]:
+        if self._min_year is None and self._max_year is None:
+            return loaded.records
+        return [
+            record
+            for record, year in zip(loaded.records, loaded.years)
+            if year_in_range(year, self._min_year, self._max_year)
+        ]
+
+    def _matching_shards(self) -> List[Path]:
+        return [shard for shard in self._require_shards() if self._may_match(shard)]
+
+    def _require_shards(self) -> List[Path]:
+        shards = self.discover_shards()
+        if not shards:
+            raise FileNotFoundError(f"No dataset shards found for: {self._location}")
+        return shards
+
+    def _fresh_stats(self, shard: Path) -> Optional[ShardStats]:
+        stats = self._stats.get(str(shard))
+        if stats is not None and stats.matches_file(shard):
+            return stats
+        return None
+
+    def _may_match(self, shard: Path) -> bool:
+        min_year, max_year = self._min_year, self._max_year
+        if min_year is None and max_year is None:
+            return True
+
+        partition_year = self.partition_values(shard).get("year")
+        if partition_year is not None and partition_year.isdigit():
+            low = high = int(partition_year)
+        else:
+            stats = self._fresh_stats(shard)
+            if stats is None:
+                return True
+            if stats.min_year is None or stats.max_year is None:
+                return False
+            low, high = stats.min_year, stats.max_year
+
+        if min_year is not None and high < min_year:
+            return False
+        if max_year is not None and low > max_year:
+            return False
+        return True
+
+    def _load_shards(self, shards: Sequence[Path]) -> None:
+        stale = [shard for shard in shards if not self._is_loaded(shard)]
+        if not stale:
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for loaded in executor.map(self._read_shard, stale):
+                self._loaded[loaded.stats.path] = loaded
+                self._stats[loaded.stats.path] = loaded.stats
+
+        self._save_stats_cache()
+
+    def _is_loaded(self, shard: Path) -> bool:
+        loaded = self._loaded.get(str(shard))
+        return loaded is not None and loaded.stats.matches_file(shard)
+
+    def _read_shard(self, shard: Path) -> _LoadedShard:
+        stat = shard.stat()
+        dataframe = pd.read_csv(shard, dtype=CsvBookRepository.COLUMN_DTYPES)
+        validate_columns(dataframe, CsvBookRepository.REQUIRED_COLUMNS)
+        records = dataframe_to_records(dataframe)
+        years = [extract_year(record.publication_date) for record in records]
+        known_years = [year for year in years if year is not None]
+
+        stats = ShardStats(
+            path=str(shard),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            row_count=len(records),
+            min_year=min(known_years) if known_years else None,
+            max_year=max(known_years) if known_years else None,
+            partitions=self.partition_values(shard),
+        )
+        return _LoadedShard(stats=stats, records=records, years=years)
+
+    def _load_stats_cache(self) -> Dict[str, ShardStats]:
+        if self._stats_cache_path is None or not self._stats_cache_path.exists():
+            return {}
+        try:
+            entries = json.loads(self._stats_cache_path.read_text(encoding="utf-8"))
+            return {entry["path"]: ShardStats(**entry) for entry in entries}
+        except (ValueError, TypeError, KeyError):
+            return {}
+
+    def _save_stats_cache(self) -> None:
+        if self._stats_cache_path is None:
+            return
+        self._stats_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = [asdict(stats) for stats in sorted(self._stats.values(), key=lambda item: item.path)]
+        self._stats_cache_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+
+
+def _completed(loaded: _LoadedShard) -> Future:
+    future: Future = Future()
+    future.set_result(loaded)
+    return future
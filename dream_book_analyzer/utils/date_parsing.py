@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import Optional, Tuple
 
 YEAR_PATTERN = re.compile(r"(\d{4})")
+YEAR_MONTH_PATTERN = re.compile(r"(\d{4})[-/.](\d{1,2})(?!\d)")
 
 
 def extract_year(date_value: str) -> Optional[int]:
@@ -20,3 +21,32 @@ def extract_year(date_value: str) -> Optional[int]:
     if year <= 0:
         return None
     return year
+
+
+def extract_year_month(date_value: str) -> Tuple[Optional[int], Optional[int]]:
+    """Extract the year and, when present, the month from the publication date string."""
+
+    year = extract_year(date_value)
+    if year is None:
+        return None, None
+    match = YEAR_MONTH_PATTERN.search(date_value)
+    if not match or int(match.group(1)) != year:
+        return year, None
+    month = int(match.group(2))
+    if not 1 <= month <= 12:
+        return year, None
+    return year, month
+
+
+def year_in_range(year: Optional[int], min_year: Optional[int], max_year: Optional[int]) -> bool:
+    """Return True when the year lies within the inclusive bounds; unknown years never match a bound."""
+
+    if min_year is None and max_year is None:
+        return True
+    if year is None:
+        return False
+    if min_year is not None and year < min_year:
+        return False
+    if max_year is not None and year > max_year:
+        return False
+    return True
@@ -0,0 +1,82 @@
+"""Tests for ISBN validation and duplicate detection."""
+
+from __future__ import annotations
+
+from dream_book_analyzer.analytics.data_quality import DataQualityAnalyzer
+from dream_book_analyzer.domain.models import BookRecord
+
+
+def _record(isbn: str, bnb_id: str = "") -> BookRecord:
+    return BookRecord(
+        book="Title",
+        author="Author",
+        publication_date="2000",
+        language="English",
+        book_publisher="Publisher",
+        isbn=isbn,
+        bnb_id=bnb_id,
+    )
+
+
+def test_isbn_checksums() -> None:
+    isbns = [
+        "0-306-40615-2",  # valid ISBN-10
+        "080442957X",  # valid ISBN-10 with an X check digit
+        "978-0-306-40615-7",  # valid ISBN-13
+        "0306406153",  # ISBN-10 with a bad check digit
+        "9780306406158",  # ISBN-13 with a bad check digit
+        "12345",  # malformed
+        "03064X6152",  # X outside the check digit position
+        "",  # missing
+    ]
+
+    report = DataQualityAnalyzer().analyze(_record(isbn) for isbn in isbns)
+
+    assert report.total == 8
+    assert report.missing_isbn == 1
+    assert report.valid_isbn10 == 2
+    assert report.valid_isbn13 == 1
+    assert report.invalid_checksum == 2
+    assert report.malformed_isbn == 2
+    assert report.invalid_examples == ["0306406153", "9780306406158", "12345", "03064X6152"]
+
+
+def test_isbn_keeps_leading_zeros_and_lowercase_x() -> None:
+    report = DataQualityAnalyzer().analyze([_record("0306406152"), _record("080442957x")])
+
+    assert report.valid_isbn10 == 2
+
+
+def test_duplicates_across_chunk_boundary() -> None:
+    records = [
+        _record("0306406152", "GB1"),
+        _record("080442957X", "GB2"),
+        _record("0306406152", "GB3"),
+        _record("9780306406157", "GB1"),
+        _record("0306406152", "GB4"),
+    ]
+
+    report = DataQualityAnalyzer(chunk_size=2).analyze(records)
+
+    assert report.isbn_duplicates.duplicate_keys == 1
+    assert report.isbn_duplicates.duplicate_rows == 2
+    assert report.isbn_duplicates.examples == [("0306406152", 3)]
+    assert report.bnb_duplicates.duplicate_keys == 1
+    assert report.bnb_duplicates.duplicate_rows == 1
+    assert report.bnb_duplicates.examples == [("GB1", 2)]
+
+
+def test_duplicates_match_single_chunk() -> None:
+    records = [_record(f"978030640{index % 7:04d}", f"GB{index % 11}") for index in range(100)]
+
+    chunked = DataQualityAnalyzer(chunk_size=3).analyze(records)
+    whole = DataQualityAnalyzer(chunk_size=1_000).analyze(records)
+
+    for summary in (chunked, whole):
+        assert summary.isbn_duplicates.duplicate_keys == 7
+        assert summary.isbn_duplicates.duplicate_rows == 93
+        assert summary.bnb_duplicates.duplicate_keys == 11
+        assert summary.bnb_duplicates.duplicate_rows == 89
+    # Example counts cover every occurrence, not only those after the first chunk.
+    for key, count in chunked.isbn_duplicates.examples:
+        assert count == sum(record.isbn == key for record in records)
@@ -0,0 +1,81 @@
+"""Tests for HyperLogLog distinct counts and cardinality statistics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dream_book_analyzer.analytics.cardinality import CardinalityAnalyzer, CardinalityStatistics
+from dream_book_analyzer.domain.models import BookRecord
+from dream_book_analyzer.utils.hyperloglog import HyperLogLog, hash_values
+
+
+@pytest.mark.parametrize("cardinality", [50, 1_000, 20_000, 300_000])
+def test_estimate_within_three_standard_errors(cardinality: int) -> None:
+    sketch = HyperLogLog(12)
+    sketch.add_hashes(hash_values(f"value-{index}" for index in range(cardinality)))
+
+    error = abs(sketch.estimate() - cardinality) / cardinality
+
+    assert error <= 3 * sketch.standard_error
+
+
+def test_repeated_values_do_not_change_estimate() -> None:
+    once = HyperLogLog(10)
+    once.add_hashes(hash_values(str(index) for index in range(5_000)))
+    repeated = HyperLogLog(10)
+    for _ in range(3):
+        repeated.add_hashes(hash_values(str(index) for index in range(5_000)))
+
+    assert np.array_equal(once.registers, repeated.registers)
+
+
+def test_merge_equals_union() -> None:
+    left = HyperLogLog(12)
+    left.add_hashes(hash_values(str(index) for index in range(0, 6_000)))
+    right = HyperLogLog(12)
+    right.add_hashes(hash_values(str(index) for index in range(4_000, 10_000)))
+    union = HyperLogLog(12)
+    union.add_hashes(hash_values(str(index) for index in range(10_000)))
+
+    left.merge(right)
+
+    assert np.array_equal(left.registers, union.registers)
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(10))
+
+
+def test_hashes_are_stable() -> None:
+    assert hash_values(["Smith, John"]).tolist() == hash_values(["Smith, John"]).tolist()
+    assert hash_values([]).dtype == np.dtype("<u8")
+
+
+def test_statistics_round_trip(tmp_path: Path) -> None:
+    records = [
+        BookRecord(
+            book=f"Book {index}",
+            author=f"Author {chr(65 + index % 20)}",
+            publication_date=str(1990 + index % 3),
+            language="English" if index % 2 else "French",
+            book_publisher=f"Publisher {index % 7}",
+            isbn=None,
+            bnb_id="",
+        )
+        for index in range(200)
+    ]
+    statistics = CardinalityAnalyzer(chunk_size=30).analyze(records, fingerprint="shard")
+
+    path = tmp_path / "statistics.npz"
+    statistics.save(path)
+    loaded = CardinalityStatistics.load(path)
+
+    assert loaded.fingerprint == "shard"
+    assert loaded.overall_counts() == statistics.overall_counts() == {
+        "authors": 20,
+        "publishers": 7,
+        "languages": 2,
+    }
+    assert loaded.yearly_counts() == statistics.yearly_counts()
+    assert sorted(loaded.yearly_counts()) == [1990, 1991, 1992]
@@ -0,0 +1,95 @@
+"""Tests for materialized rollups."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+from dream_book_analyzer.analytics.publication_trends import PublicationTrendsAnalyzer
+from dream_book_analyzer.analytics.rollups import DIMENSIONS, GRAINS, RollupBuilder, Rollups
+from dream_book_analyzer.data.sharded_csv_repository import ShardedCsvBookRepository
+from dream_book_analyzer.domain.models import BookRecord
+
+HEADER = "book,author,publication date,language,book publisher,ISBN,BNB id\n"
+
+
+def _records() -> List[BookRecord]:
+    dates = ["1998-03", "1998", "2001-12-05", "c. 1850", "unknown", "2001", "1999-01", ""]
+    return [
+        BookRecord(
+            book=f"Book {index}",
+            author="Author",
+            publication_date=dates[index % len(dates)],
+            language=["English", "French", ""][index % 3],
+            book_publisher=f"Publisher {index % 4}",
+            isbn="0306406152" if index % 5 else None,
+            bnb_id=f"GB{index}",
+        )
+        for index in range(60)
+    ]
+
+
+def _write_shard(path: Path, years: range) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [f"Book {year},Author,{year}-06,English,Publisher,0306406152,GB{year}\n" for year in years]
+    path.write_text(HEADER + "".join(rows), encoding="utf-8")
+
+
+def test_year_trend_matches_publication_trends() -> None:
+    records = _records()
+
+    rollups = RollupBuilder().build(records)
+
+    assert rollups.trend("year") == PublicationTrendsAnalyzer().analyze(records)
+
+
+def test_combine_matches_single_build() -> None:
+    records = _records()
+    builder = RollupBuilder()
+
+    whole = builder.build(records)
+    combined = Rollups.combine([builder.build(records[:7]), builder.build(records[7:40]), builder.build(records[40:])])
+
+    for grain in GRAINS:
+        assert combined.periods(grain).tolist() == whole.periods(grain).tolist()
+        assert combined.totals(grain).tolist() == whole.totals(grain).tolist()
+        for dimension in DIMENSIONS:
+            assert combined.breakdown(grain, dimension) == whole.breakdown(grain, dimension)
+
+
+def test_combine_without_parts_is_empty() -> None:
+    assert Rollups.combine([]).trend("year") == {}
+
+
+def test_load_or_build_rebuilds_only_changed_shards(tmp_path: Path) -> None:
+    _write_shard(tmp_path / "data" / "a.csv", range(1990, 1995))
+    _write_shard(tmp_path / "data" / "b.csv", range(2000, 2003))
+    builder = RollupBuilder(tmp_path / "rollups")
+
+    first = builder.load_or_build(ShardedCsvBookRepository(tmp_path / "data"))
+    assert first.trend("decade") == {1990: 5, 2000: 3}
+
+    archives = sorted((tmp_path / "rollups").glob("*.npz"))
+    assert len(archives) == 2
+    mtimes = [archive.stat().st_mtime_ns for archive in archives]
+
+    _write_shard(tmp_path / "data" / "b.csv", range(2000, 2010))
+    second = builder.load_or_build(ShardedCsvBookRepository(tmp_path / "data"))
+
+    assert second.trend("decade") == {1990: 5, 2000: 10}
+    assert sum(archive.stat().st_mtime_ns != mtime for archive, mtime in zip(archives, mtimes)) == 1
+
+
+def test_load_or_build_recovers_from_truncated_archive(tmp_path: Path) -> None:
+    _write_shard(tmp_path / "data" / "a.csv", range(1990, 1995))
+    builder = RollupBuilder(tmp_path / "rollups")
+    builder.load_or_build(ShardedCsvBookRepository(tmp_path / "data"))
+
+    (archive,) = (tmp_path / "rollups").glob("*.npz")
+    archive.write_bytes(archive.read_bytes()[:40])
+    os.utime(archive)
+
+    assert builder.load_or_build(ShardedCsvBookRepository(tmp_path / "data")).trend("year") == {
+        year: 1 for year in range(1990, 1995)
+    }